@@ -0,0 +1,72 @@
+"""
+Microbenchmark of the per-call overhead of the public functions (argument validation, URL and payload building).
+
+The HTTP layer is stubbed at the `requests` level, so the script runs offline and on any revision of the package,
+which allows comparing the numbers against older commits:
+
+    python benchmarks/bench_request_building.py
+    git worktree add /tmp/phantom-baseline <commit> && python /tmp/phantom-baseline/benchmarks/bench_request_building.py
+"""
+
+from pathlib import Path
+
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Avoid fetching the extension version from the Chrome Web Store at import time
+os.environ.setdefault("PHANTOM_VERSION", "1.0.0")
+
+import requests
+
+BODY = {"data": {}, "results": [], "quests": [], "transactions": [], "history": []}
+
+class StubResponse:
+    status_code = 200
+    headers = {}
+    content = json.dumps(BODY).encode()
+    text = '\\"version\\": \\"1.0.0\\"'
+
+    def json(self) -> dict:
+        return json.loads(self.content)
+
+stub = lambda *args, **kwargs: StubResponse()
+
+requests.get = stub
+requests.post = stub
+requests.Session.request = stub
+
+from phantom_api import learn, quests, tokens, trending, wallet
+from phantom_api.core import ChainId, ChartTimeFrame, NATIVE_TOKEN
+
+WALLET_ADDRESSES = [(ChainId.ETHEREUM, "0xABCDEF"), (ChainId.SOLANA, "So1"), (ChainId.POLYGON, "0xAB"), (ChainId.BASE, "0xCD")] * 25
+
+CASES = {
+    "learn()": lambda: learn.learn(),
+    "get_trending_tokens()": lambda: trending.get_trending_tokens(),
+    "get_trending_dapps(2 chains)": lambda: trending.get_trending_dapps(chain_ids=[ChainId.SOLANA, ChainId.ETHEREUM]),
+    "get_price(native)": lambda: tokens.get_price(ChainId.SOLANA, NATIVE_TOKEN),
+    "get_price_history": lambda: tokens.get_price_history(ChainId.ETHEREUM, "0xab", ChartTimeFrame.DAY),
+    "get_balance(100 wallets)": lambda: wallet.get_balance(WALLET_ADDRESSES),
+    "get_history(100 wallets)": lambda: wallet.get_history(WALLET_ADDRESSES),
+    "get_quests(1 wallet)": lambda: quests.get_quests(WALLET_ADDRESSES[:1]),
+}
+
+def main() -> None:
+    for name, function in CASES.items():
+        number = 2000 if "100" in name else 50000
+
+        try:
+            function()
+        except Exception as e:
+            print(f"{name:32s} {type(e).__name__}")
+            continue
+
+        elapsed = min(timeit.repeat(function, number=number, repeat=5)) / number
+        print(f"{name:32s} {elapsed * 1e6:8.2f} us")
+
+if __name__ == "__main__":
+    main()
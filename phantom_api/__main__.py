@@ -0,0 +1,251 @@
+from concurrent.futures import ThreadPoolExecutor, Future, FIRST_COMPLETED, wait
+from collections import deque
+from enum import Enum
+from typing import Callable, Iterator, TextIO, get_args, get_origin, get_type_hints
+
+import argparse
+import inspect
+import json
+import sys
+
+from . import learn, quests, tokens, trending, wallet
+from . import core
+from .core import ValidationError
+
+def _public_functions() -> dict[str, tuple[Callable, dict]]:
+    """
+    Collect the public functions exposed by the API modules, together with their type hints.
+
+    :return: A dictionary mapping each function name to the function itself and its type hints.
+    :rtype: `dict[str, tuple[Callable, dict]]`
+    """
+
+    functions = {}
+
+    for module in [learn, quests, tokens, trending, wallet]:
+        for name, function in inspect.getmembers(module, inspect.isfunction):
+            if not name.startswith("_") and function.__module__ == module.__name__:
+                functions[name] = (function, get_type_hints(function))
+
+    return functions
+
+FUNCTIONS: dict[str, tuple[Callable, dict]] = _public_functions()
+
+def _convert(value, annotation):
+    """
+    Convert a decoded JSON value to the type expected by a function parameter.
+
+    Enum members can be given either by value (e.g., `"solana:101"`) or by name (e.g., `"SOLANA"`).
+
+    :param value: Decoded JSON value.
+    :param annotation: Type annotation of the parameter.
+
+    :return: The converted value.
+    """
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        if isinstance(value, annotation):
+            return value
+
+        try:
+            return annotation(value)
+        except ValueError:
+            pass
+
+        try:
+            return annotation[value]
+        except KeyError:
+            raise ValueError(f"Invalid {annotation.__name__}: {value}.") from None
+
+    if origin is list and args and isinstance(value, list):
+        return [_convert(item, args[0]) for item in value]
+
+    if origin is tuple and args and isinstance(value, list) and len(value) == len(args):
+        return tuple(_convert(item, arg) for item, arg in zip(value, args))
+
+    return value
+
+def _call(operation: dict) -> object:
+    """
+    Execute a single decoded operation.
+
+    Each operation is a JSON object with a `function` key (the name of a public function) and an optional `args` object with its keyword arguments.
+
+    :param operation: Decoded operation.
+    :type operation: `dict`
+
+    :return: The result of the call.
+    :rtype: `object`
+    """
+
+    name = operation.get("function")
+    kwargs = operation.get("args", {})
+
+    if name not in FUNCTIONS:
+        raise ValueError(f"function must be one of the following values: {', '.join(FUNCTIONS)}.")
+
+    if not isinstance(kwargs, dict):
+        raise ValueError("args must be a JSON object.")
+
+    function, hints = FUNCTIONS[name]
+
+    kwargs = {key: _convert(value, hints[key]) if key in hints else value for key, value in kwargs.items()}
+
+    return function(**kwargs)
+
+def _run(index: int, line: str) -> str:
+    """
+    Execute a single operation and serialize its outcome as a JSONL record.
+
+    The optional `id` of the operation is echoed back in the record, whether the call succeeds or fails.
+
+    :param index: Zero-based line number of the operation in the input.
+    :type index: `int`
+
+    :param line: Raw JSONL line.
+    :type line: `str`
+
+    :return: A JSON encoded record containing either the result or the error.
+    :rtype: `str`
+    """
+
+    record = {"index": index}
+
+    try:
+        operation = json.loads(line)
+
+        if not isinstance(operation, dict):
+            raise ValueError("Each operation must be a JSON object.")
+
+        if operation.get("id") is not None:
+            record["id"] = operation["id"]
+
+        record["result"] = _call(operation)
+
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+
+    try:
+        return json.dumps(record, default=str)
+    except (TypeError, ValueError) as e:
+        record.pop("result", None)
+        record["error"] = f"{type(e).__name__}: {e}"
+
+        return json.dumps(record, default=str)
+
+def _operations(stream: TextIO) -> Iterator[tuple[int, str]]:
+    """
+    Lazily iterate over the non-empty lines of a JSONL stream.
+
+    :param stream: Input stream.
+    :type stream: `TextIO`
+
+    :return: An iterator of (line number, line) pairs.
+    :rtype: `Iterator[tuple[int, str]]`
+    """
+
+    for index, line in enumerate(stream):
+        line = line.strip()
+
+        if line:
+            yield index, line
+
+def _write(output_stream: TextIO, record: str) -> None:
+    """
+    Write a single JSONL record and flush it, so results are streamed as soon as they are ready.
+
+    :param output_stream: Stream where JSONL results are written.
+    :type output_stream: `TextIO`
+
+    :param record: JSON encoded record.
+    :type record: `str`
+    """
+
+    output_stream.write(record + "\n")
+    output_stream.flush()
+
+def run(input_stream: TextIO, output_stream: TextIO, workers: int = 8, ordered: bool = False) -> None:
+    """
+    Execute a stream of JSONL operations concurrently and stream their results as JSONL.
+
+    At most `2 * workers` operations are in flight at any time, so memory usage does not depend on the size of the input.
+
+    :param input_stream: Stream of JSONL operations.
+    :type input_stream: `TextIO`
+
+    :param output_stream: Stream where JSONL results are written.
+    :type output_stream: `TextIO`
+
+    :param workers: Optional number of concurrent workers. Defaults to `8`.
+    :type workers: `int`
+
+    :param ordered: Optional flag to emit results in input order instead of completion order. Defaults to `False`.
+    :type ordered: `bool`
+    """
+
+    if not isinstance(workers, int) or workers < 1:
+        raise ValidationError("workers must be greater than 0.")
+
+    window = 2 * workers
+    pool_size = core.POOL_SIZE
+
+    # Keep one connection alive per worker while running
+    if workers > pool_size:
+        core.set_pool_size(workers)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+
+            if ordered:
+                pending: deque[Future] = deque()
+
+                for index, line in _operations(input_stream):
+                    if len(pending) >= window:
+                        _write(output_stream, pending.popleft().result())
+
+                    pending.append(executor.submit(_run, index, line))
+
+                while pending:
+                    _write(output_stream, pending.popleft().result())
+
+            else:
+                pending: set[Future] = set()
+
+                for index, line in _operations(input_stream):
+                    if len(pending) >= window:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                        for future in done:
+                            _write(output_stream, future.result())
+
+                    pending.add(executor.submit(_run, index, line))
+
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        _write(output_stream, future.result())
+
+    finally:
+        if core.POOL_SIZE != pool_size:
+            core.set_pool_size(pool_size)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m phantom_api", description="Run a stream of JSONL operations against the Phantom API and stream the results as JSONL.")
+    parser.add_argument("input", nargs="?", type=argparse.FileType("r"), default=sys.stdin, help="JSONL file with one operation per line. Defaults to stdin.")
+    parser.add_argument("-o", "--output", type=argparse.FileType("w"), default=sys.stdout, help="Output JSONL file. Defaults to stdout.")
+    parser.add_argument("-w", "--workers", type=int, default=8, help="Number of concurrent workers. Defaults to 8.")
+    parser.add_argument("--ordered", action="store_true", help="Emit results in input order instead of completion order.")
+
+    args = parser.parse_args()
+
+    if args.workers < 1:
+        parser.error("workers must be greater than 0.")
+
+    run(input_stream=args.input, output_stream=args.output, workers=args.workers, ordered=args.ordered)
+
+if __name__ == "__main__":
+    main()
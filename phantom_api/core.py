@@ -1,10 +1,18 @@
+from collections import OrderedDict
 from enum import Enum
+from functools import lru_cache
+from threading import Lock
+
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
 
 import requests
+import json
+import os
 import re
 
-# Retrieve the extension version from the Chrome Web Store (required for certain requests)
-PHANTOM_VERSION: str = re.search(r'\\"version\\"(?:\s*):(?:\s*)\\"([\d.]+)\\"', requests.get(f"https://chromewebstore.google.com/detail/phantom/bfnaelmomeimhlpmgjnjophhpkkoljpa").text).group(1)
+# Retrieve the extension version from the Chrome Web Store (required for certain requests). Can be overridden with the PHANTOM_VERSION environment variable
+PHANTOM_VERSION: str = os.environ.get("PHANTOM_VERSION") or re.search(r'\\"version\\"(?:\s*):(?:\s*)\\"([\d.]+)\\"', requests.get(f"https://chromewebstore.google.com/detail/phantom/bfnaelmomeimhlpmgjnjophhpkkoljpa").text).group(1)
 
 # Solana -> SOL
 # Ethereum -> ETH
@@ -13,6 +21,26 @@ PHANTOM_VERSION: str = re.search(r'\\"version\\"(?:\s*):(?:\s*)\\"([\d.]+)\\"',
 # BITCOIN -> BTC
 NATIVE_TOKEN: str = "nativeToken"
 
+# Base URL of the API, read by fetch on every request. Can be overridden (e.g., to point to a local stand-in server) with the PHANTOM_API_URL environment variable or by assigning core.API_URL
+API_URL: str = os.environ.get("PHANTOM_API_URL", "https://api.phantom.app").rstrip("/")
+
+# Maximum number of responses kept for conditional requests
+CACHE_SIZE: int = 1024
+
+# Maximum number of connections kept alive per host. Can be raised with set_pool_size (e.g., for many concurrent workers)
+POOL_SIZE: int = 32
+
+# Shared session: keeps connections alive and negotiates compression (gzip/deflate, plus brotli when installed)
+session = requests.Session()
+session.headers["Accept-Encoding"] = DEFAULT_ACCEPT_ENCODING
+session.mount("http://", HTTPAdapter(pool_maxsize=POOL_SIZE))
+session.mount("https://", HTTPAdapter(pool_maxsize=POOL_SIZE))
+
+# Normalized request -> (ETag, Last-Modified, raw body)
+_cache: OrderedDict[tuple, tuple[str | None, str | None, bytes]] = OrderedDict()
+_cache_lock = Lock()
+_pool_lock = Lock()
+
 class ChainId(Enum):
     SOLANA = "solana:101"
     ETHEREUM = "eip155:1"
@@ -85,12 +113,304 @@ class TokenTimeFrame(Enum):
     def __str__(self):
         return self.value
 
-get_slip44 = lambda chain_id: {
+class ValidationError(ValueError):
+    """
+    Raised when an argument of a public function is not valid.
+    """
+
+# Enum -> {member: value}. Lookups both validate and convert a member in a single step
+ENUM_VALUES: dict[type[Enum], dict[Enum, str]] = {
+    enum: {item: item.value for item in enum}
+    for enum in [ChainId, ChartTimeFrame, RankBy, SearchContext, SortBy, SortDirection, TimeFrame, TokenTimeFrame]
+}
+
+ALL_CHAIN_IDS: tuple[ChainId, ...] = tuple(ChainId)
+
+SLIP44: dict[ChainId, str] = {
     ChainId.SOLANA: "501",
     ChainId.ETHEREUM: "60",
     ChainId.BASE: "8453",
     ChainId.POLYGON: "966",
     ChainId.SUI: "784"
-}.get(chain_id, Exception("Chain not supported!"))
+}
+
+# Chains whose addresses are case sensitive
+CASE_SENSITIVE_CHAINS: frozenset[ChainId] = frozenset([ChainId.SOLANA, ChainId.BITCOIN])
+
+# ChainId -> (chain ID value, case sensitive address)
+_ACCOUNT_FORMATS: dict[ChainId, tuple[str, bool]] = {item: (item.value, item in CASE_SENSITIVE_CHAINS) for item in ChainId}
+
+def get_slip44(chain_id: ChainId) -> str:
+    """
+    Get the SLIP-0044 coin type of the native token of a chain.
+
+    :param chain_id: The blockchain of the token.
+    :type chain_id: `ChainId`
+
+    :return: The SLIP-0044 coin type.
+    :rtype: `str`
+    """
+
+    try:
+        return SLIP44[chain_id]
+    except (KeyError, TypeError):
+        raise ValidationError(f"Chain not supported: {chain_id}.") from None
+
+format_address = lambda chain_id, address: address if chain_id in CASE_SENSITIVE_CHAINS else address.lower()
+
+def enum_value(name: str, value: Enum, enum: type[Enum]) -> str:
+    """
+    Validate an enum argument and return its string value.
+
+    :param name: Name of the argument.
+    :type name: `str`
+
+    :param value: Value of the argument.
+    :type value: `Enum`
+
+    :param enum: Expected enum.
+    :type enum: `type[Enum]`
+
+    :return: The string value of the member.
+    :rtype: `str`
+    """
+
+    try:
+        return ENUM_VALUES[enum][value]
+    except (KeyError, TypeError):
+        raise ValidationError(f"{name} must be one of the following values: {', '.join(ENUM_VALUES[enum].values())}.") from None
+
+def validate_int(name: str, value: int, minimum: int, maximum: int) -> None:
+    """
+    Validate an integer argument within an inclusive range.
+
+    :param name: Name of the argument.
+    :type name: `str`
+
+    :param value: Value of the argument.
+    :type value: `int`
+
+    :param minimum: Minimum allowed value.
+    :type minimum: `int`
+
+    :param maximum: Maximum allowed value.
+    :type maximum: `int`
+    """
+
+    # bool is a subclass of int, but True / False are not valid counts
+    if not isinstance(value, int) or isinstance(value, bool) or not minimum <= value <= maximum:
+        raise ValidationError(f"{name} must be between {minimum} and {maximum}.")
+
+def validate_str(name: str, value: str, empty: bool = True) -> None:
+    """
+    Validate a string argument, optionally rejecting empty strings.
+
+    :param name: Name of the argument.
+    :type name: `str`
+
+    :param value: Value of the argument.
+    :type value: `str`
+
+    :param empty: Optional flag to allow empty strings. Defaults to `True`.
+    :type empty: `bool`
+    """
+
+    if not isinstance(value, str):
+        raise ValidationError(f"Invalid {name}.")
+
+    if not empty and not value:
+        raise ValidationError(f"{name} cannot be empty.")
+
+@lru_cache(maxsize=256)
+def _join_chain_ids(chain_ids: tuple[ChainId, ...], separator: str) -> str:
+    values = ENUM_VALUES[ChainId]
+
+    try:
+        return separator.join([values[item] for item in chain_ids])
+    except KeyError:
+        raise ValidationError(f"Each value in chain_ids must be one of the following values: {', '.join(values.values())}.") from None
+
+def join_chain_ids(chain_ids: list[ChainId], separator: str = "&chainIds[]=", default: tuple[ChainId, ...] = ALL_CHAIN_IDS) -> str:
+    """
+    Validate a list of chains and join their values into a query fragment. Fragments are cached per chain set and separator.
+
+    :param chain_ids: Queried chains.
+    :type chain_ids: `list[ChainId]`
+
+    :param separator: Optional separator between chain values. Defaults to `"&chainIds[]="`.
+    :type separator: `str`
+
+    :param default: Optional chains used when `chain_ids` is empty. Defaults to `ALL_CHAIN_IDS`.
+    :type default: `tuple[ChainId, ...]`
+
+    :return: The joined chain values.
+    :rtype: `str`
+    """
+
+    if not isinstance(chain_ids, list):
+        raise ValidationError("chain_ids must be a list.")
+
+    try:
+        return _join_chain_ids(tuple(chain_ids) or default, separator)
+    except TypeError:
+        raise ValidationError(f"Each value in chain_ids must be one of the following values: {', '.join(ENUM_VALUES[ChainId].values())}.") from None
+
+def format_accounts(wallet_addresses: list[tuple[ChainId, str]], resource_type: bool = False) -> list[dict]:
+    """
+    Validate a list of wallet addresses and build the corresponding account objects of a payload.
+
+    :param wallet_addresses: List of wallet addresses, where each address is paired with its corresponding ChainId.
+    :type wallet_addresses: `list[tuple[ChainId, str]]`
+
+    :param resource_type: Optional flag to add the `resourceType` field to each account. Defaults to `False`.
+    :type resource_type: `bool`
+
+    :return: The account objects.
+    :rtype: `list[dict]`
+    """
+
+    if not isinstance(wallet_addresses, list):
+        raise ValidationError("wallet_addresses must be a list.")
+
+    accounts = []
+
+    for wallet_address in wallet_addresses:
+        try:
+            chain_id, address = wallet_address
+            value, case_sensitive = _ACCOUNT_FORMATS[chain_id]
+        except (KeyError, TypeError, ValueError):
+            raise ValidationError("Invalid wallet addresses format: each wallet address must be a tuple of (ChainId, str).") from None
+
+        if not isinstance(address, str):
+            raise ValidationError("Invalid wallet addresses format: each wallet address must be a tuple of (ChainId, str).")
+
+        if resource_type:
+            accounts.append({"chainId": value, "address": address if case_sensitive else address.lower(), "resourceType": "address"})
+        else:
+            accounts.append({"chainId": value, "address": address if case_sensitive else address.lower()})
+
+    return accounts
+
+def _cache_key(method: str, url: str, data: str | None) -> tuple:
+    """
+    Build the cache key of a request. Query parameters are sorted so that equivalent URLs share the same entry.
+    """
+
+    url, _, query = url.partition("?")
+
+    if query:
+        url = f"{url}?{'&'.join(sorted(query.split('&')))}"
+
+    return method, url, data
+
+def clear_cache() -> None:
+    """
+    Drop all the responses stored for conditional requests.
+    """
+
+    with _cache_lock:
+        _cache.clear()
+
+def set_pool_size(size: int) -> None:
+    """
+    Set the maximum number of connections kept alive per host by the shared session.
+
+    :param size: Maximum number of connections per host.
+    :type size: `int`
+    """
+
+    global POOL_SIZE
+
+    if not isinstance(size, int) or size < 1:
+        raise ValidationError("size must be greater than 0.")
+
+    with _pool_lock:
+        POOL_SIZE = size
+
+        for prefix in ["http://", "https://"]:
+            session.get_adapter(prefix).close()
+            session.mount(prefix, HTTPAdapter(pool_maxsize=size))
+
+def _decode(content: bytes) -> object:
+    """
+    Decode a JSON body, returning `None` if it is empty or not valid JSON.
+    """
+
+    try:
+        return json.loads(content) if content else None
+    except ValueError:
+        return None
+
+def fetch(method: str, url: str, payload: dict | None = None, headers: dict | None = None) -> tuple[int, object]:
+    """
+    Send a request and decode its JSON body.
+
+    Responses carrying an `ETag` or `Last-Modified` validator are stored, and the following identical requests are sent as conditional requests.
+    When the server answers `304 Not Modified`, the stored body is decoded again instead of being downloaded, so every call gets its own object.
+
+    :param method: HTTP method.
+    :type method: `str`
+
+    :param url: Request URL, or a path (e.g., `"/tokens/v1"`) relative to `API_URL`.
+    :type url: `str`
+
+    :param payload: Optional JSON payload. Defaults to `None`.
+    :type payload: `dict`
+
+    :param headers: Optional additional headers. Defaults to `None`.
+    :type headers: `dict`
+
+    :return: The status code and the decoded body (`None` if the body is not valid JSON).
+    :rtype: `tuple[int, object]`
+    """
+
+    if url.startswith("/"):
+        url = f"{API_URL}{url}"
+
+    data = json.dumps(payload) if payload is not None else None
+    key = _cache_key(method=method, url=url, data=data)
+    headers = dict(headers or {})
+
+    with _cache_lock:
+        cached = _cache.get(key)
+
+    if cached is not None:
+        etag, last_modified, body = cached
+
+        if etag:
+            headers["If-None-Match"] = etag
+
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    response = session.request(method=method, url=url, headers=headers, data=data)
+
+    if response.status_code == 304:
+        if cached is not None:
+            with _cache_lock:
+                if key in _cache:
+                    _cache.move_to_end(key)
+
+            return 200, _decode(body)
+
+        # Nothing to serve for an unsolicited 304 (e.g., from an intermediate cache): ask again for a full response
+        response = session.request(method=method, url=url, headers={**headers, "Cache-Control": "no-cache"}, data=data)
+
+        if response.status_code == 304:
+            raise requests.HTTPError("Unexpected 304 response for a request without a stored body.", response=response)
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+
+    with _cache_lock:
+        if response.status_code == 200 and (etag or last_modified):
+            _cache[key] = (etag, last_modified, response.content)
+            _cache.move_to_end(key)
+
+            while len(_cache) > CACHE_SIZE:
+                _cache.popitem(last=False)
+
+        else:
+            _cache.pop(key, None)
 
-format_address = lambda chain_id, address: address if chain_id in [ChainId.SOLANA, ChainId.BITCOIN] else address.lower()
\ No newline at end of file
+    return response.status_code, _decode(response.content)
@@ -1,7 +1,5 @@
 from typing import List
 
-import requests
-
 from .core import *
 
 def search_token(query: str, chain_ids: List[ChainId] = [], page_size: int = 100, search_context: SearchContext = SearchContext.EXPLORE, all_results: bool = True) -> list:
@@ -27,29 +25,23 @@ def search_token(query: str, chain_ids: List[ChainId] = [], page_size: int = 100
     :rtype: `list`
     """
     
-    assert isinstance(query, str) and len(query), "query cannot be empty."
-    assert isinstance(page_size, int) and 1 <= page_size <= 100, "page_size must be between 1 and 100."
-    assert isinstance(chain_ids, list) and all(item in ChainId for item in chain_ids), f"Each value in chain_ids must be one of the following: {', '.join([str(item) for item in ChainId])}."
-    assert search_context in SearchContext, f"search_context must be one of the following values: {', '.join([str(item) for item in SearchContext])}."
-
-    if not len(chain_ids):
-        chain_ids = list(ChainId)
+    validate_str(name="query", value=query, empty=False)
+    validate_int(name="page_size", value=page_size, minimum=1, maximum=100)
+    search_context = enum_value(name="search_context", value=search_context, enum=SearchContext)
 
-    chain_ids = ",".join([str(item) for item in chain_ids])
+    chain_ids = join_chain_ids(chain_ids=chain_ids, separator=",")
 
     if all_results:
         page_size = 100
 
     all_results = []
 
-    base_url = f"https://api.phantom.app/search/v1?query={query}&chainIds={chain_ids}&pageSize={page_size}&searchContext={str(search_context)}&platform=extension&searchTypes=fungible"
+    base_url = f"/search/v1?query={query}&chainIds={chain_ids}&pageSize={page_size}&searchContext={search_context}&platform=extension&searchTypes=fungible"
     url = base_url
 
     while True:
 
-        response = requests.get(url=url)
-
-        data = response.json()
+        _, data = fetch(method="GET", url=url)
 
         has_more = data.get("hasMore", False)
 
@@ -77,23 +69,20 @@ def get_token(chain_id: ChainId, address: str) -> dict:
     :rtype: `dict`
     """
 
-    assert chain_id in ChainId, f"chain_id must be one of the following values: {', '.join([str(item) for item in ChainId])}."
-    assert isinstance(address, str), "Invalid address."
+    chain = enum_value(name="chain_id", value=chain_id, enum=ChainId)
+    validate_str(name="address", value=address)
 
     if address == NATIVE_TOKEN:
-        url = f"https://api.phantom.app/tokens/v1/{str(chain_id)}/{NATIVE_TOKEN}/{get_slip44(chain_id=chain_id)}"
+        url = f"/tokens/v1/{chain}/{NATIVE_TOKEN}/{get_slip44(chain_id=chain_id)}"
     else:
-        url = f"https://api.phantom.app/tokens/v1/{str(chain_id)}/address/{address}"
+        url = f"/tokens/v1/{chain}/address/{address}"
 
-    response = requests.get(url=url)
+    status_code, data = fetch(method="GET", url=url)
 
-    if response.status_code != 200:
+    if status_code != 200:
         return {}
-    
-    data = response.json()
-    data = data.get("data", {})
 
-    del data["chain"]
+    data = {key: value for key, value in data.get("data", {}).items() if key != "chain"}
 
     return data
 
@@ -111,21 +100,19 @@ def get_price(chain_id: ChainId, address: str) -> dict:
     :rtype: `dict`
     """
 
-    assert chain_id in ChainId, f"chain_id must be one of the following values: {', '.join([str(item) for item in ChainId])}."
-    assert isinstance(address, str), "Invalid address."
+    chain = enum_value(name="chain_id", value=chain_id, enum=ChainId)
+    validate_str(name="address", value=address)
 
     if address == NATIVE_TOKEN:
-        url = f"https://api.phantom.app/price/v1/{str(chain_id)}/{NATIVE_TOKEN}/{get_slip44(chain_id=chain_id)}"
+        url = f"/price/v1/{chain}/{NATIVE_TOKEN}/{get_slip44(chain_id=chain_id)}"
     else:
-        url = f"https://api.phantom.app/price/v1/{str(chain_id)}/address/{address}"
+        url = f"/price/v1/{chain}/address/{address}"
     
-    response = requests.get(url=url)
+    status_code, data = fetch(method="GET", url=url)
 
-    if response.status_code != 200:
+    if status_code != 200:
         return {}
     
-    data = response.json()
-    
     return data
 
 def get_price_history(chain_id: ChainId, address: str, timeframe: ChartTimeFrame) -> list:
@@ -145,21 +132,20 @@ def get_price_history(chain_id: ChainId, address: str, timeframe: ChartTimeFrame
     :rtype: `list`
     """
 
-    assert chain_id in ChainId, f"chain_id must be one of the following values: {', '.join([str(item) for item in ChainId])}."
-    assert isinstance(address, str), "Invalid address."
-    assert timeframe in ChartTimeFrame, f"timeframe must be one of the following values: {', '.join([str(item) for item in ChartTimeFrame])}."
+    chain = enum_value(name="chain_id", value=chain_id, enum=ChainId)
+    validate_str(name="address", value=address)
+    timeframe = enum_value(name="timeframe", value=timeframe, enum=ChartTimeFrame)
 
     if address == NATIVE_TOKEN:
-        url = f"https://api.phantom.app/price-history/v1?token={str(chain_id)}/{NATIVE_TOKEN}:{get_slip44(chain_id=chain_id)}&type={str(timeframe)}"
+        url = f"/price-history/v1?token={chain}/{NATIVE_TOKEN}:{get_slip44(chain_id=chain_id)}&type={timeframe}"
     else:
-        url = f"https://api.phantom.app/price-history/v1?token={str(chain_id)}/address:{address}&type={str(timeframe)}"
+        url = f"/price-history/v1?token={chain}/address:{address}&type={timeframe}"
     
-    response = requests.get(url=url)
+    status_code, data = fetch(method="GET", url=url)
 
-    if response.status_code != 200:
+    if status_code != 200:
         return []
     
-    data = response.json()
     data = data.get("history", [])
 
     return data
\ No newline at end of file
@@ -1,9 +1,10 @@
 from typing import List
 
-import requests
-
 from .core import *
 
+# Chains queried by default for trending collections
+COLLECTIONS_CHAIN_IDS: tuple[ChainId, ...] = (ChainId.SOLANA, ChainId.ETHEREUM, ChainId.POLYGON, ChainId.BITCOIN)
+
 def get_trending_tokens(timeframe: TokenTimeFrame = TokenTimeFrame.DAY, sort_by: SortBy = SortBy.RANK, sort_direction: SortDirection = SortDirection.ASC, limit: int = 100, chain_ids: List[ChainId] = []) -> list:
     """
     Get trending tokens.
@@ -27,25 +28,20 @@ def get_trending_tokens(timeframe: TokenTimeFrame = TokenTimeFrame.DAY, sort_by:
     :rtype: `list`
     """
 
-    assert timeframe in TokenTimeFrame, f"timeframe must be one of the following values: {', '.join([str(item) for item in TokenTimeFrame])}."
-    assert sort_by in SortBy, f"sort_by must be one of the following values: {', '.join([str(item) for item in SortBy])}."
-    assert sort_direction in SortDirection, f"sort_direction must be one of the following values: {', '.join([str(item) for item in SortDirection])}."
-    assert isinstance(limit, int) and 1 <= limit <= 100, "limit must be between 1 and 100."
-    assert isinstance(chain_ids, list) and all(item in ChainId for item in chain_ids), f"Each value in chain_ids must be one of the following: {', '.join([str(item) for item in ChainId])}."
+    timeframe = enum_value(name="timeframe", value=timeframe, enum=TokenTimeFrame)
+    sort_by = enum_value(name="sort_by", value=sort_by, enum=SortBy)
+    sort_direction = enum_value(name="sort_direction", value=sort_direction, enum=SortDirection)
+    validate_int(name="limit", value=limit, minimum=1, maximum=100)
 
-    if not len(chain_ids):
-        chain_ids = list(ChainId)
-
-    chain_ids = "&chainIds[]=".join([str(item) for item in ChainId])
+    chain_ids = join_chain_ids(chain_ids=chain_ids)
     
-    url = f"https://api.phantom.app/explore/v2/trending-tokens?timeFrame={str(timeframe)}&sortBy={str(sort_by)}&sortDirection={str(sort_direction)}&limit={limit}&chainIds[]={chain_ids}"
+    url = f"/explore/v2/trending-tokens?timeFrame={timeframe}&sortBy={sort_by}&sortDirection={sort_direction}&limit={limit}&chainIds[]={chain_ids}"
 
-    response = requests.get(url=url)
+    status_code, data = fetch(method="GET", url=url)
 
-    if response.status_code != 200:
+    if status_code != 200:
         return []
-
-    data = response.json()
+    
     data = data.get("results", [])
 
     return data
@@ -70,24 +66,19 @@ def get_trending_dapps(limit: int = 50, rank_by: RankBy = RankBy.TRENDING, timef
     :rtype: `list`
     """
 
-    assert isinstance(limit, int) and 1 <= limit <= 50, "limit must not be lower than 1 or greater than 50."
-    assert rank_by in RankBy, f"rank_by must be one of the following values: {', '.join([str(item) for item in RankBy])}."
-    assert timeframe in TimeFrame, f"timeframe must be one of the following values: {', '.join([str(item) for item in TimeFrame])}."
-    assert isinstance(chain_ids, list) and all(item in ChainId for item in chain_ids), f"Each value in chain_ids must be one of the following values: {', '.join([str(item) for item in ChainId])}."
-
-    if not len(chain_ids):
-        chain_ids = list(ChainId)
+    validate_int(name="limit", value=limit, minimum=1, maximum=50)
+    rank_by = enum_value(name="rank_by", value=rank_by, enum=RankBy)
+    timeframe = enum_value(name="timeframe", value=timeframe, enum=TimeFrame)
 
-    chain_ids = "&chainIds[]=".join([str(item) for item in chain_ids])
+    chain_ids = join_chain_ids(chain_ids=chain_ids)
 
-    url = f"https://api.phantom.app/explore/v1/trending-dapps?limit={limit}&rankBy={str(rank_by)}&timeframe={str(timeframe)}&chainIds[]={chain_ids}&rankAlgo=default&platform=extension&locale=en&appVersion=1.0.0"
+    url = f"/explore/v1/trending-dapps?limit={limit}&rankBy={rank_by}&timeframe={timeframe}&chainIds[]={chain_ids}&rankAlgo=default&platform=extension&locale=en&appVersion=1.0.0"
 
-    response = requests.get(url=url)
+    status_code, data = fetch(method="GET", url=url)
 
-    if response.status_code != 200:
+    if status_code != 200:
         return []
     
-    data = response.json()
     data = data.get("data", [])
 
     return data
@@ -112,24 +103,19 @@ def get_trending_collections(limit: int = 50, rank_by: RankBy = RankBy.TRENDING,
     :rtype: `list`
     """
 
-    assert isinstance(limit, int) and 1 <= limit <= 50, "limit must not be lower than 1 or greater than 50."
-    assert rank_by in RankBy, f"rank_by must be one of the following values: {', '.join([str(item) for item in RankBy])}."
-    assert timeframe in TimeFrame, f"timeframe must be one of the following values: {', '.join([str(item) for item in TimeFrame])}."
-    assert isinstance(chain_ids, list) and all(item in ChainId for item in chain_ids), f"Each value in chain_ids must be one of the following values: {', '.join([str(item) for item in ChainId])}."
-
-    if not len(chain_ids):
-        chain_ids = [ChainId.SOLANA, ChainId.ETHEREUM, ChainId.POLYGON, ChainId.BITCOIN]
+    validate_int(name="limit", value=limit, minimum=1, maximum=50)
+    rank_by = enum_value(name="rank_by", value=rank_by, enum=RankBy)
+    timeframe = enum_value(name="timeframe", value=timeframe, enum=TimeFrame)
 
-    chain_ids = f"&chainIds[]=".join([str(item) for item in chain_ids])
+    chain_ids = join_chain_ids(chain_ids=chain_ids, default=COLLECTIONS_CHAIN_IDS)
 
-    url = f"https://api.phantom.app/explore/v1/trending-collections?limit={limit}&rankBy={str(rank_by)}&timeframe={str(timeframe)}&chainIds[]={chain_ids}&rankAlgo=default&platform=extension&locale=en&appVersion=1.0.0"
+    url = f"/explore/v1/trending-collections?limit={limit}&rankBy={rank_by}&timeframe={timeframe}&chainIds[]={chain_ids}&rankAlgo=default&platform=extension&locale=en&appVersion=1.0.0"
 
-    response = requests.get(url=url)
+    status_code, data = fetch(method="GET", url=url)
 
-    if response.status_code != 200:
+    if status_code != 200:
         return []
     
-    data = response.json()
     data = data.get("data", [])
 
     return data
\ No newline at end of file
@@ -1,8 +1,5 @@
 from typing import List
 
-import requests
-import json
-
 from .tokens import *
 from .core import *
 
@@ -17,16 +14,13 @@ def get_balance(wallet_addresses: List[tuple[ChainId, str]]) -> dict:
     :rtype: `dict`
     """
 
-    assert isinstance(wallet_addresses, list), "Wallet addresses object must be a list."
-    assert all(wallet_address[0] in ChainId and isinstance(wallet_address[1], str) for wallet_address in wallet_addresses), "Invalid wallet addresses format: each wallet address must be a tuple of (ChainId, str)."
-
-    url = f"https://api.phantom.app/tokens/v1"
+    url = f"/tokens/v1"
 
-    payload = {"addresses": [{"chainId": str(wallet_address[0]), "address": format_address(*wallet_address)} for wallet_address in wallet_addresses]}
+    payload = {"addresses": format_accounts(wallet_addresses=wallet_addresses)}
 
-    response = requests.post(url=url, data=json.dumps(payload))
+    _, data = fetch(method="POST", url=url, payload=payload)
 
-    return response.json()
+    return data
 
 def get_quotes(from_chain_id: ChainId, from_token: str, from_taker: str, to_chain_id: ChainId, to_token: str, to_taker: str, sell_amount: float | int, auto_slippage: bool = True, slippage: float | int = 0) -> dict:
     """
@@ -63,50 +57,56 @@ def get_quotes(from_chain_id: ChainId, from_token: str, from_taker: str, to_chai
     :rtype: `dict`
     """
 
-    assert from_chain_id in ChainId, f"from_chain_id must be one of the following values: {', '.join([str(item) for item in ChainId])}."
-    assert isinstance(from_token, str), "Invalid from_token."
-    assert isinstance(from_taker, str), "Invalid from_taker."
+    from_chain = enum_value(name="from_chain_id", value=from_chain_id, enum=ChainId)
+    validate_str(name="from_token", value=from_token)
+    validate_str(name="from_taker", value=from_taker)
+
+    to_chain = enum_value(name="to_chain_id", value=to_chain_id, enum=ChainId)
+    validate_str(name="to_token", value=to_token)
+    validate_str(name="to_taker", value=to_taker)
 
-    assert from_chain_id in ChainId, f"to_chain_id must be one of the following values: {', '.join([str(item) for item in ChainId])}."
-    assert isinstance(from_token, str), "Invalid to_token."
-    assert isinstance(from_taker, str), "Invalid to_taker."
+    if not isinstance(sell_amount, (float, int)):
+        raise ValidationError("Invalid sell_amount.")
 
-    assert isinstance(sell_amount, (float, int)), "Invalid sell_amount."
-    assert sell_amount > 0, "sell_amount must be greater than 0."
+    if sell_amount <= 0:
+        raise ValidationError("sell_amount must be greater than 0.")
 
     if not auto_slippage:
-        assert isinstance(slippage, (float, int)), "Invalid slippage."
-        assert slippage >= 0, "slippage must be a positive value."
+        if not isinstance(slippage, (float, int)):
+            raise ValidationError("Invalid slippage.")
+
+        if slippage < 0:
+            raise ValidationError("slippage must be a positive value.")
 
     from_token = get_token(chain_id=from_chain_id, address=from_token)
 
-    url = f"https://api.phantom.app/swap/v2/quotes"
+    url = f"/swap/v2/quotes"
 
     if not from_token.get("address"):
         sell_token = {
-            "chainId": str(from_chain_id),
+            "chainId": from_chain,
             "slip44": get_slip44(chain_id=from_chain_id),
             "resourceType": NATIVE_TOKEN
         }
     
     else:
         sell_token = {
-            "chainId": str(from_chain_id),
+            "chainId": from_chain,
             "address": from_token["address"],
             "resourceType": "address"
         }
     
     if to_token == NATIVE_TOKEN:
         buy_token = {
-            "chainId": str(to_chain_id),
+            "chainId": to_chain,
             "slip44": get_slip44(chain_id=to_chain_id),
             "resourceType": NATIVE_TOKEN
         }
     
     else:
         buy_token = {
-            "chainId": str(to_chain_id),
-            "address": to_token["address"],
+            "chainId": to_chain,
+            "address": to_token,
             "resourceType": "address"
         }
 
@@ -116,7 +116,7 @@ def get_quotes(from_chain_id: ChainId, from_token: str, from_taker: str, to_chai
         "buyToken": buy_token,
 
         "taker": {
-            "chainId": str(from_chain_id),
+            "chainId": from_chain,
             "address": format_address(chain_id=from_chain_id, address=from_taker),
             "resourceType": "address"
         },
@@ -131,7 +131,7 @@ def get_quotes(from_chain_id: ChainId, from_token: str, from_taker: str, to_chai
 
     if from_chain_id != to_chain_id:
         payload["takerDestination"] = {
-            "chainId": str(to_chain_id),
+            "chainId": to_chain,
             "address": format_address(chain_id=to_chain_id, address=to_taker),
             "resourceType": "address"
         }
@@ -139,9 +139,9 @@ def get_quotes(from_chain_id: ChainId, from_token: str, from_taker: str, to_chai
         payload["refuel"] = 1
         payload["ignoreRefuelFailures"] = True
 
-    response = requests.post(url=url, headers={"x-phantom-version": PHANTOM_VERSION}, data=json.dumps(payload))
+    _, data = fetch(method="POST", url=url, payload=payload, headers={"x-phantom-version": PHANTOM_VERSION})
 
-    return response.json()
+    return data
 
 def get_best_quote(from_chain_id: ChainId, from_token: str, from_taker: str, to_chain_id: ChainId, to_token: str, to_taker: str, sell_amount: float | int, auto_slippage: bool = True, slippage: float | int = 0) -> dict:
     """
@@ -191,7 +191,7 @@ def get_best_quote(from_chain_id: ChainId, from_token: str, from_taker: str, to_
     )
 
     if len(quotes["quotes"]):
-        quotes["quotes"] = [max(quotes["quotes"], key=lambda x: float(x["buyAmount"]))]
+        quotes = {**quotes, "quotes": [max(quotes["quotes"], key=lambda x: float(x["buyAmount"]))]}
 
     return quotes
 
@@ -209,20 +209,16 @@ def get_history(wallet_addresses: List[tuple[ChainId, str]], all_results: bool =
     :rtype: `dict`
     """
 
-    assert isinstance(wallet_addresses, list), "Wallet addresses object must be a list."
-    assert all(wallet_address[0] in ChainId and isinstance(wallet_address[1], str) for wallet_address in wallet_addresses), "Invalid wallet addresses format: each wallet address must be a tuple of (ChainId, str)."
-
-    base_url = f"https://api.phantom.app/history/v2"
+    base_url = f"/history/v2"
 
-    payload = {"accounts": [{"chainId": str(wallet_address[0]), "address": format_address(*wallet_address)} for wallet_address in wallet_addresses]}
+    payload = {"accounts": format_accounts(wallet_addresses=wallet_addresses)}
     payload["isSpam"] = False
 
     url = base_url
     history = []
 
     while True:
-        response = requests.post(url=url, data=json.dumps(payload))
-        results = response.json()
+        _, results = fetch(method="POST", url=url, payload=payload)
 
         history.extend(results["results"])
         return history
@@ -246,13 +242,10 @@ def get_pending_transactions(wallet_addresses: List[tuple[ChainId, str]]) -> lis
     :rtype: `dict`
     """
 
-    assert isinstance(wallet_addresses, list), "Wallet addresses object must be a list."
-    assert all(wallet_address[0] in ChainId and isinstance(wallet_address[1], str) for wallet_address in wallet_addresses), "Invalid wallet addresses format: each wallet address must be a tuple of (ChainId, str)."
-
-    url = f"https://api.phantom.app/pending-transactions/v1"
+    url = f"/pending-transactions/v1"
 
-    payload = {"addresses": [{"chainId": str(wallet_address[0]), "address": format_address(*wallet_address), "resourceType": "address"} for wallet_address in wallet_addresses]}
+    payload = {"addresses": format_accounts(wallet_addresses=wallet_addresses, resource_type=True)}
 
-    response = requests.post(url=url, data=json.dumps(payload))
+    _, data = fetch(method="POST", url=url, payload=payload)
     
-    return response.json()["transactions"]
+    return data["transactions"]
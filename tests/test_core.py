@@ -0,0 +1,227 @@
+import os
+
+# Avoid fetching the extension version from the Chrome Web Store at import time
+os.environ.setdefault("PHANTOM_VERSION", "1.0.0")
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import gzip
+import json
+
+import pytest
+
+from phantom_api import core, learn, wallet
+from phantom_api.core import ChainId
+
+LAST_MODIFIED = "Wed, 01 Jan 2025 00:00:00 GMT"
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Local stand-in for the Phantom API.
+
+    - `/etag/...`: responses carry an `ETag` validator.
+    - `/last-modified/...`: responses carry a `Last-Modified` validator.
+    - `/stray-304`: answers `304` to any request not sent with `Cache-Control: no-cache`.
+    - `/tokens/v1`, `/explore/v1/learn-grid`: API endpoints with an `ETag` validator.
+
+    Every other path answers without validators. Setting `status` to an error code makes every path answer with it, without validators.
+    """
+
+    status = 200
+    received: list[dict] = []
+
+    def _respond(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+        headers = dict(self.headers)
+        type(self).received.append({"path": self.path, "headers": headers})
+
+        path = self.path.split("?")[0]
+
+        if path == "/explore/v1/learn-grid":
+            body = {"data": ["a", "b"]}
+        else:
+            body = {"path": path, "tokens": [1, 2, 3]}
+
+        validators = {}
+
+        if type(self).status == 200:
+            if path.startswith("/etag/") or path in ["/tokens/v1", "/explore/v1/learn-grid"]:
+                validators["ETag"] = '"v1"'
+
+            elif path.startswith("/last-modified/"):
+                validators["Last-Modified"] = LAST_MODIFIED
+
+        not_modified = (
+            ("ETag" in validators and headers.get("If-None-Match") == validators["ETag"]) or
+            ("Last-Modified" in validators and headers.get("If-Modified-Since") == LAST_MODIFIED) or
+            (path == "/stray-304" and "no-cache" not in headers.get("Cache-Control", ""))
+        )
+
+        if not_modified:
+            self.send_response(304)
+
+            for name, value in validators.items():
+                self.send_header(name, value)
+
+            self.end_headers()
+            return
+
+        content = json.dumps(body).encode()
+
+        self.send_response(type(self).status)
+        self.send_header("Content-Type", "application/json")
+
+        for name, value in validators.items():
+            self.send_header(name, value)
+
+        if "gzip" in headers.get("Accept-Encoding", ""):
+            content = gzip.compress(content)
+            self.send_header("Content-Encoding", "gzip")
+
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, *args) -> None:
+        pass
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    Thread(target=httpd.serve_forever, daemon=True).start()
+
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+
+    httpd.shutdown()
+    httpd.server_close()
+
+@pytest.fixture(autouse=True)
+def reset(monkeypatch, server):
+    core.clear_cache()
+    StandInHandler.status = 200
+    StandInHandler.received = []
+
+    monkeypatch.setattr(core, "API_URL", server)
+
+    yield
+
+    core.clear_cache()
+
+def test_etag_is_sent_and_304_returns_stored_body(server):
+    first = core.fetch(method="GET", url=f"{server}/etag/a")
+    second = core.fetch(method="GET", url=f"{server}/etag/a")
+
+    assert first == second == (200, {"path": "/etag/a", "tokens": [1, 2, 3]})
+    assert "If-None-Match" not in StandInHandler.received[0]["headers"]
+    assert StandInHandler.received[1]["headers"]["If-None-Match"] == '"v1"'
+
+def test_last_modified_is_sent(server):
+    core.fetch(method="GET", url=f"{server}/last-modified/a")
+    status_code, data = core.fetch(method="GET", url=f"{server}/last-modified/a")
+
+    assert status_code == 200
+    assert data == {"path": "/last-modified/a", "tokens": [1, 2, 3]}
+    assert StandInHandler.received[1]["headers"]["If-Modified-Since"] == LAST_MODIFIED
+
+def test_304_returns_equal_but_separate_objects(server):
+    _, first = core.fetch(method="GET", url=f"{server}/etag/a")
+    first["tokens"].append(99)
+
+    _, second = core.fetch(method="GET", url=f"{server}/etag/a")
+    _, third = core.fetch(method="GET", url=f"{server}/etag/a")
+
+    assert second == third == {"path": "/etag/a", "tokens": [1, 2, 3]}
+    assert second is not third
+
+def test_public_functions_return_separate_objects(server):
+    balance = wallet.get_balance([(ChainId.SOLANA, "address")])
+    balance["tokens"].append(99)
+
+    assert wallet.get_balance([(ChainId.SOLANA, "address")])["tokens"] == [1, 2, 3]
+
+    learn.learn().append("junk")
+
+    assert learn.learn() == ["a", "b"]
+    assert StandInHandler.received[-1]["headers"]["If-None-Match"] == '"v1"'
+
+def test_query_parameters_are_normalized(server):
+    core.fetch(method="GET", url=f"{server}/etag/a?x=1&y=2")
+    core.fetch(method="GET", url=f"{server}/etag/a?y=2&x=1")
+
+    assert StandInHandler.received[1]["headers"]["If-None-Match"] == '"v1"'
+
+def test_lru_eviction(server, monkeypatch):
+    monkeypatch.setattr(core, "CACHE_SIZE", 2)
+
+    for name in ["a", "b", "c"]:
+        core.fetch(method="GET", url=f"{server}/etag/{name}")
+
+    assert len(core._cache) == 2
+
+    core.fetch(method="GET", url=f"{server}/etag/a")
+
+    assert "If-None-Match" not in StandInHandler.received[-1]["headers"]
+
+def test_non_200_removes_entry(server):
+    core.fetch(method="GET", url=f"{server}/etag/a")
+    assert len(core._cache) == 1
+
+    StandInHandler.status = 500
+    status_code, _ = core.fetch(method="GET", url=f"{server}/etag/a")
+
+    assert status_code == 500
+    assert not core._cache
+
+    StandInHandler.status = 200
+    core.fetch(method="GET", url=f"{server}/etag/a")
+
+    assert "If-None-Match" not in StandInHandler.received[-1]["headers"]
+
+def test_responses_without_validators_are_not_stored(server):
+    core.fetch(method="GET", url=f"{server}/plain")
+    core.fetch(method="GET", url=f"{server}/plain")
+
+    assert not core._cache
+    assert "If-None-Match" not in StandInHandler.received[1]["headers"]
+
+def test_unsolicited_304_requests_full_response(server):
+    status_code, data = core.fetch(method="POST", url=f"{server}/stray-304", payload={"a": 1})
+
+    assert status_code == 200
+    assert data == {"path": "/stray-304", "tokens": [1, 2, 3]}
+    assert StandInHandler.received[1]["headers"]["Cache-Control"] == "no-cache"
+
+def test_gzip_is_negotiated_and_decoded(server):
+    status_code, data = core.fetch(method="GET", url=f"{server}/plain")
+
+    assert status_code == 200
+    assert data == {"path": "/plain", "tokens": [1, 2, 3]}
+    assert "gzip" in StandInHandler.received[0]["headers"]["Accept-Encoding"]
+
+def test_set_pool_size(server, monkeypatch):
+    monkeypatch.setattr(core, "POOL_SIZE", core.POOL_SIZE)
+
+    core.fetch(method="GET", url=f"{server}/plain")
+
+    previous = core.session.get_adapter(server)
+    assert previous.poolmanager.pools
+
+    core.set_pool_size(64)
+
+    assert core.POOL_SIZE == 64
+    assert core.session.get_adapter(server)._pool_maxsize == 64
+    assert not previous.poolmanager.pools
+
+    core.set_pool_size(32)
+
+    with pytest.raises(core.ValidationError):
+        core.set_pool_size(0)
+
+def test_api_url_is_read_at_call_time(server):
+    assert core.fetch(method="GET", url="/etag/a") == (200, {"path": "/etag/a", "tokens": [1, 2, 3]})
+    assert wallet.get_balance([(ChainId.SOLANA, "address")])["tokens"] == [1, 2, 3]
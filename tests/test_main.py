@@ -0,0 +1,159 @@
+import os
+
+# Avoid fetching the extension version from the Chrome Web Store at import time
+os.environ.setdefault("PHANTOM_VERSION", "1.0.0")
+
+from threading import Lock
+from typing import List, get_type_hints
+
+import io
+import json
+import random
+import time
+
+import pytest
+
+from phantom_api import core
+from phantom_api import __main__ as runner
+from phantom_api.core import ChainId, ValidationError
+
+class InFlight:
+    """
+    Track the number of stub calls running at the same time.
+    """
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.current = 0
+        self.peak = 0
+
+    def __enter__(self) -> None:
+        with self.lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def __exit__(self, *args) -> None:
+        with self.lock:
+            self.current -= 1
+
+in_flight = InFlight()
+
+def stub(chain_id: ChainId = ChainId.SOLANA, wallet_addresses: List[tuple[ChainId, str]] = [], delay: float = 0) -> dict:
+    with in_flight:
+        time.sleep(delay)
+
+    if not isinstance(chain_id, ChainId):
+        raise ValidationError("chain_id must be a ChainId.")
+
+    return {"chain_id": chain_id.value, "wallet_addresses": [[item[0].value, item[1]] for item in wallet_addresses]}
+
+class FlushCounter(io.StringIO):
+    flushes = 0
+
+    def flush(self) -> None:
+        self.flushes += 1
+        super().flush()
+
+@pytest.fixture(autouse=True)
+def register_stub(monkeypatch):
+    monkeypatch.setitem(runner.FUNCTIONS, "stub", (stub, get_type_hints(stub)))
+
+    in_flight.current = 0
+    in_flight.peak = 0
+
+def execute(lines: list[str], **kwargs) -> list[dict]:
+    output_stream = io.StringIO()
+    runner.run(input_stream=io.StringIO("\n".join(lines) + "\n"), output_stream=output_stream, **kwargs)
+
+    return [json.loads(line) for line in output_stream.getvalue().splitlines()]
+
+def operations(count: int) -> list[str]:
+    return [json.dumps({"id": f"op-{i}", "function": "stub", "args": {"delay": random.random() / 200}}) for i in range(count)]
+
+def test_ordered_output_matches_input_order():
+    records = execute(operations(50), workers=4, ordered=True)
+
+    assert [record["index"] for record in records] == list(range(50))
+    assert [record["id"] for record in records] == [f"op-{i}" for i in range(50)]
+
+def test_unordered_output_contains_every_index():
+    records = execute(operations(50), workers=4)
+
+    assert sorted(record["index"] for record in records) == list(range(50))
+    assert all("result" in record for record in records)
+
+@pytest.mark.parametrize("ordered", [False, True])
+def test_in_flight_operations_are_bounded(monkeypatch, ordered):
+    workers = 3
+    read = []
+    written = []
+    backlog = []
+
+    operations_stream = runner._operations
+    write = runner._write
+
+    def tracked_operations(stream):
+        for index, line in operations_stream(stream):
+            # Every operation read before this one has been submitted
+            backlog.append(len(read) - len(written))
+            read.append(index)
+
+            yield index, line
+
+    def tracked_write(output_stream, record):
+        written.append(record)
+        write(output_stream, record)
+
+    monkeypatch.setattr(runner, "_operations", tracked_operations)
+    monkeypatch.setattr(runner, "_write", tracked_write)
+
+    execute(operations(60), workers=workers, ordered=ordered)
+
+    assert len(written) == 60
+    assert max(backlog) == 2 * workers
+    assert in_flight.peak <= workers
+
+def test_id_is_echoed_on_errors():
+    records = execute([json.dumps({"id": "c", "function": "stub", "args": {"chain_id": "NOPE"}})])
+
+    assert records[0]["id"] == "c"
+    assert "error" in records[0]
+
+@pytest.mark.parametrize("line", [
+    "[1, 2]",
+    "not json",
+    json.dumps({"function": "unknown"}),
+    json.dumps({"function": "stub", "args": [1]})
+])
+def test_invalid_operations_become_error_records(line):
+    records = execute([line])
+
+    assert records[0]["index"] == 0
+    assert "error" in records[0] and "result" not in records[0]
+
+def test_enums_convert_by_value_and_name():
+    records = execute([
+        json.dumps({"function": "stub", "args": {"chain_id": "eip155:1"}}),
+        json.dumps({"function": "stub", "args": {"chain_id": "ETHEREUM"}}),
+        json.dumps({"function": "stub", "args": {"wallet_addresses": [["SOLANA", "a"], ["eip155:137", "b"]]}})
+    ], ordered=True)
+
+    assert records[0]["result"]["chain_id"] == records[1]["result"]["chain_id"] == "eip155:1"
+    assert records[2]["result"]["wallet_addresses"] == [["solana:101", "a"], ["eip155:137", "b"]]
+
+def test_each_record_is_flushed():
+    output_stream = FlushCounter()
+    runner.run(input_stream=io.StringIO("\n".join(operations(5))), output_stream=output_stream, workers=2)
+
+    assert output_stream.flushes == 5
+
+def test_pool_size_is_restored():
+    pool_size = core.POOL_SIZE
+
+    execute(operations(2), workers=pool_size + 8)
+
+    assert core.POOL_SIZE == pool_size
+
+def test_invalid_workers():
+    with pytest.raises(ValidationError):
+        execute(operations(1), workers=0)
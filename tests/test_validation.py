@@ -0,0 +1,139 @@
+import os
+
+# Avoid fetching the extension version from the Chrome Web Store at import time
+os.environ.setdefault("PHANTOM_VERSION", "1.0.0")
+
+from pathlib import Path
+
+import subprocess
+import sys
+
+import pytest
+
+from phantom_api import trending
+from phantom_api.core import (
+    ALL_CHAIN_IDS,
+    ChainId,
+    SortBy,
+    TimeFrame,
+    ValidationError,
+    enum_value,
+    format_accounts,
+    get_slip44,
+    join_chain_ids,
+    validate_int,
+    validate_str
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def test_validation_error_is_value_error():
+    assert issubclass(ValidationError, ValueError)
+
+def test_enum_value():
+    assert enum_value(name="sort_by", value=SortBy.RANK, enum=SortBy) == "rank"
+
+@pytest.mark.parametrize("value", [TimeFrame.DAY, "rank", "RANK", None, []])
+def test_enum_value_rejects_other_types(value):
+    with pytest.raises(ValidationError, match="sort_by"):
+        enum_value(name="sort_by", value=value, enum=SortBy)
+
+@pytest.mark.parametrize("value", [0, 101, "5", 5.0, True, False, None])
+def test_validate_int_rejects(value):
+    with pytest.raises(ValidationError, match="limit"):
+        validate_int(name="limit", value=value, minimum=1, maximum=100)
+
+def test_validate_int():
+    validate_int(name="limit", value=1, minimum=1, maximum=100)
+    validate_int(name="limit", value=100, minimum=1, maximum=100)
+
+def test_validate_str():
+    validate_str(name="address", value="")
+    validate_str(name="query", value="bonk", empty=False)
+
+    with pytest.raises(ValidationError):
+        validate_str(name="address", value=None)
+
+    with pytest.raises(ValidationError, match="query cannot be empty"):
+        validate_str(name="query", value="", empty=False)
+
+def test_join_chain_ids():
+    assert join_chain_ids(chain_ids=[ChainId.SOLANA, ChainId.SUI]) == "solana:101&chainIds[]=sui:mainnet"
+    assert join_chain_ids(chain_ids=[ChainId.SOLANA, ChainId.SUI], separator=",") == "solana:101,sui:mainnet"
+
+def test_join_chain_ids_defaults():
+    assert join_chain_ids(chain_ids=[], separator=",") == ",".join(item.value for item in ALL_CHAIN_IDS)
+    assert join_chain_ids(chain_ids=[], separator=",", default=(ChainId.BASE,)) == "eip155:8453"
+
+@pytest.mark.parametrize("chain_ids", [
+    "solana:101",
+    (ChainId.SOLANA,),
+    None,
+    ["solana:101"],
+    [ChainId.SOLANA, SortBy.RANK],
+    [[ChainId.SOLANA]],
+    [{}]
+])
+def test_join_chain_ids_rejects(chain_ids):
+    with pytest.raises(ValidationError):
+        join_chain_ids(chain_ids=chain_ids)
+
+def test_format_accounts():
+    wallet_addresses = [(ChainId.ETHEREUM, "0xAB"), (ChainId.SOLANA, "So1AB"), [ChainId.BITCOIN, "bc1Q"]]
+
+    assert format_accounts(wallet_addresses=wallet_addresses) == [
+        {"chainId": "eip155:1", "address": "0xab"},
+        {"chainId": "solana:101", "address": "So1AB"},
+        {"chainId": "bip122:000000000019d6689c085ae165831e93", "address": "bc1Q"}
+    ]
+
+    assert format_accounts(wallet_addresses=wallet_addresses[:1], resource_type=True) == [
+        {"chainId": "eip155:1", "address": "0xab", "resourceType": "address"}
+    ]
+
+@pytest.mark.parametrize("wallet_addresses", [
+    (ChainId.SOLANA, "a"),
+    "a",
+    [(ChainId.SOLANA,)],
+    [(ChainId.SOLANA, "a", "b")],
+    [(ChainId.SOLANA, 1)],
+    [("solana:101", "a")],
+    [([ChainId.SOLANA], "a")],
+    [None]
+])
+def test_format_accounts_rejects(wallet_addresses):
+    with pytest.raises(ValidationError):
+        format_accounts(wallet_addresses=wallet_addresses)
+
+def test_get_slip44():
+    assert get_slip44(chain_id=ChainId.SOLANA) == "501"
+
+    with pytest.raises(ValidationError):
+        get_slip44(chain_id=ChainId.BITCOIN)
+
+def test_public_function_rejects_bool_limit(monkeypatch):
+    monkeypatch.setattr(trending, "fetch", lambda **kwargs: pytest.fail("request sent"))
+
+    with pytest.raises(ValidationError):
+        trending.get_trending_tokens(limit=True)
+
+def test_validation_runs_under_optimize():
+    code = (
+        "from phantom_api import trending\n"
+        "from phantom_api.core import ValidationError\n"
+        "try:\n"
+        "    trending.get_trending_tokens(limit=0)\n"
+        "except ValidationError:\n"
+        "    print('raised')\n"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-O", "-c", code],
+        cwd=ROOT,
+        env={**os.environ, "PHANTOM_VERSION": "1.0.0"},
+        capture_output=True,
+        text=True,
+        timeout=60
+    )
+
+    assert result.stdout.strip() == "raised", result.stderr